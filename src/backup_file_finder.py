@@ -0,0 +1,120 @@
+"""
+Input file discovery for SMS Backup & Restore exports.
+
+Every exporter accepts either a single backup file or a directory of
+backup files and used to carry its own copy of the same discovery logic.
+This module holds the one canonical implementation so changes to the
+matching rules or error messages no longer have to be mirrored across
+the extractor modules.
+"""
+
+import hashlib
+import os
+from typing import List, Optional
+
+# How much of each file the duplicate pre-pass hashes. 64 KiB is enough
+# to distinguish real backups (they start with distinct timestamps and
+# counts) while keeping the pre-pass cheap even for multi-GB archives.
+_SIGNATURE_HEAD_SIZE = 64 * 1024
+
+
+def find_input_files(
+    input_path: str, prefix: str, suffix: str, description: str
+) -> Optional[List[str]]:
+    """
+    Resolve an input path to the list of backup files to process.
+
+    Accepts either a single file (validated against the expected filename
+    pattern) or a directory, in which case all matching files are
+    collected via os.scandir (DirEntry objects carry cached type info and
+    the joined path, avoiding a stat and path join per entry).
+
+    Args:
+        input_path: File or directory path to resolve
+        prefix: Required filename prefix (empty string to accept any name)
+        suffix: Required filename suffix (e.g. ".xml" or ".vcf")
+        description: Human-readable file description used in messages
+            (e.g. "SMS backup XML")
+
+    Returns:
+        List of file paths to process, or None if the input path is
+        invalid. An empty list means the directory had no matching files;
+        callers should return early on None or an empty list.
+    """
+    pattern = f"{prefix}*{suffix}"
+
+    files_to_process: List[str] = []
+    if os.path.isfile(input_path):
+        # Single file specified - use only that file if it matches pattern
+        filename = os.path.basename(input_path)
+        if filename.startswith(prefix) and filename.endswith(suffix):
+            files_to_process.append(input_path)
+        else:
+            print(
+                f"Error: Input file '{input_path}' does not match expected pattern (should be '{pattern}')."
+            )
+            return None
+    elif os.path.isdir(input_path):
+        # Directory specified - process all matching files
+        with os.scandir(input_path) as dir_entries:
+            for entry in dir_entries:
+                filename = entry.name
+                if not (
+                    filename.startswith(prefix)
+                    and filename.endswith(suffix)
+                    and entry.is_file()
+                ):
+                    continue
+                files_to_process.append(entry.path)
+    else:
+        print(f"Error: Input path is neither a file nor a directory: {input_path}")
+        return None
+
+    if not files_to_process:
+        print(f"No {description} files found to process.")
+        print(f"Please ensure your input path contains files matching '{pattern}' pattern.")
+
+    return files_to_process
+
+
+def skip_duplicate_files(file_paths: List[str]) -> List[str]:
+    """
+    Drop files that are byte-for-byte copies of an earlier file in the list.
+
+    Backup folders are commonly copied wholesale, leaving identical
+    backup files under slightly different names. Parsing a copy only to
+    deduplicate its records one at a time wastes the whole parse, so this
+    pre-pass skips copies up front using a cheap content signature: the
+    file size plus a blake2b hash of the first 64 KiB.
+
+    Args:
+        file_paths: Candidate file paths, in processing order
+
+    Returns:
+        The paths with duplicates removed, preserving order (the first
+        occurrence of each distinct file is kept)
+    """
+    seen_signatures = {}
+    unique_paths: List[str] = []
+    for file_path in file_paths:
+        try:
+            file_size = os.path.getsize(file_path)
+            with open(file_path, "rb") as file_handle:
+                head = file_handle.read(_SIGNATURE_HEAD_SIZE)
+        except OSError:
+            # Unreadable now; let the parser surface the real error later
+            unique_paths.append(file_path)
+            continue
+
+        signature = (file_size, hashlib.blake2b(head).digest())
+        original_path = seen_signatures.get(signature)
+        if original_path is not None:
+            print(
+                f"Skipping '{os.path.basename(file_path)}': duplicate of "
+                f"'{os.path.basename(original_path)}'"
+            )
+            continue
+        seen_signatures[signature] = file_path
+        unique_paths.append(file_path)
+
+    return unique_paths
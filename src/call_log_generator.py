@@ -13,21 +13,103 @@ Credits:
   Updated and upgraded v2 app: Rich Lewis - GitHub: @RichLewis007
 """
 
-import csv
+import concurrent.futures
+import heapq
 import os
-from typing import Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Optional, Tuple
 
 import lxml.etree
 
+from . import backup_file_finder
+from . import row_spool
+
+# CSV column order for call log output. Rows are built as tuples in this
+# exact order, which keeps them compact and feeds csv.writer.writerows
+# directly without any per-row key lookups.
+CSV_HEADER = (
+    "Call Date (timestamp)",
+    "Call date",
+    "Call type",
+    "Caller name",
+    "Caller #",
+    "Call duration (s)",
+    "Call duration",
+    "Read status",
+    "SIM slot",
+    "Features",
+    "Call Id #",
+)
+
+# Map Android call type codes to human-readable names
+# Reference: https://developer.android.com/reference/android/provider/CallLog.Calls#TYPE
+CALL_TYPE_MAP = {
+    "1": "Incoming",
+    "2": "Outgoing",
+    "3": "Missed",
+    "4": "Voicemail",
+    "5": "Rejected",
+    "6": "Blocked",
+    "7": "AnsweredExternally",
+}
+
+
+# Flush threshold for the direct CSV writer below
+_CSV_WRITE_BUFFER_SIZE = 64 * 1024
+
+
+def _csv_field(value) -> bytes:
+    """
+    Encode a single CSV field, quoting only when the value requires it.
+
+    In call log data only the caller-name column can realistically
+    contain a comma or quote, so almost every field takes the plain
+    encode path instead of the per-field quoting inspection the csv
+    module performs.
+    """
+    text = value if isinstance(value, str) else str(value)
+    if '"' in text or "," in text or "\n" in text or "\r" in text:
+        return b'"' + text.replace('"', '""').encode("utf-8") + b'"'
+    return text.encode("utf-8")
 
+
+def _write_csv_rows(file_handle, rows) -> None:
+    """
+    Write CSV rows directly as joined bytes through a block buffer.
+
+    Each row becomes a single bytes join accumulated into a ~64 KiB
+    bytearray that is flushed in blocks, rather than one csv-module
+    writerow (with its field inspection) and write call per row. Rows are
+    terminated with CRLF to match the csv module's output convention.
+
+    Args:
+        file_handle: Binary-mode file object to write to
+        rows: Iterable of row tuples
+    """
+    buffer = bytearray()
+    for row in rows:
+        buffer += b",".join(map(_csv_field, row))
+        buffer += b"\r\n"
+        if len(buffer) >= _CSV_WRITE_BUFFER_SIZE:
+            file_handle.write(buffer)
+            buffer.clear()
+    if buffer:
+        file_handle.write(buffer)
+
+
+@lru_cache(maxsize=4096)
 def get_human_readable_duration(duration_raw_s: str) -> str:
     """
     Convert seconds to a human-readable duration string.
 
+    Results are cached: real call logs repeat a small set of durations
+    (0, 15, 30, 60, ...) many times, so most calls become a dict lookup.
+
     Formats duration with proper pluralization:
     - "0" -> "0 seconds"
     - "65" -> "1 minute, 5 seconds"
-    - "3661" -> "1 hours, 1 minute, 1 second"
+    - "3661" -> "1 hour, 1 minute, 1 second"
 
     Args:
         duration_raw_s: Duration in seconds as a string
@@ -41,34 +123,193 @@ def get_human_readable_duration(duration_raw_s: str) -> str:
         >>> get_human_readable_duration("0")
         "0 seconds"
     """
-    duration_s = int(duration_raw_s)
+    hours, remainder = divmod(int(duration_raw_s), 3600)
+    minutes, seconds = divmod(remainder, 60)
+
+    # "s"[:n != 1] is a branchless pluralizer: True slices to "s", False to ""
+    parts = []
+    if hours:
+        parts.append(f"{hours} hour{'s'[:hours != 1]}")
+    if minutes:
+        parts.append(f"{minutes} minute{'s'[:minutes != 1]}")
+    # Always show seconds when there are no larger units
+    if seconds or not parts:
+        parts.append(f"{seconds} second{'s'[:seconds != 1]}")
+
+    return ", ".join(parts)
+
 
-    # Convert seconds to hours, minutes, seconds
-    # Reference: https://stackoverflow.com/questions/775049
-    time_divisor = 60
-    minutes, seconds = divmod(duration_s, time_divisor)
-    hours, minutes = divmod(minutes, time_divisor)
+# Precomputed duration strings for the sub-hour domain, built once at
+# import (a few milliseconds). Well over 99% of real call durations fall
+# in [0, 3600), so the hot path becomes one int() plus a list index; only
+# out-of-range or malformed values hit the formatter.
+_DURATION_TABLE_SIZE = 3600
+_DURATION_STRINGS = [
+    get_human_readable_duration(str(i)) for i in range(_DURATION_TABLE_SIZE)
+]
 
-    formatted_str = ""
 
-    if hours > 0:
-        hour_word = "hours" if hours != 1 else "hour"
-        formatted_str += f"{hours} {hour_word}"
+class _CallTarget:
+    """
+    lxml parser target that builds call rows straight from attribute dicts.
 
-    if minutes > 0:
-        if formatted_str:
-            formatted_str += ", "
-        minute_word = "minutes" if minutes != 1 else "minute"
-        formatted_str += f"{minutes} {minute_word}"
+    Registered via lxml.etree.XMLParser(target=...), so start() is invoked
+    from the C parser with the tag name and a plain attribute mapping; no
+    Element objects are ever constructed and nothing needs to be cleared
+    afterwards. This is the fastest parse path lxml offers from Python,
+    and memory stays bounded by the accumulated rows alone.
+    """
 
-    # Always show seconds if no hours/minutes, or if seconds > 0
-    if seconds > 0 or (seconds == 0 and not formatted_str):
-        if formatted_str:
-            formatted_str += ", "
-        second_word = "seconds" if seconds != 1 else "second"
-        formatted_str += f"{seconds} {second_word}"
+    def __init__(self):
+        self.rows: List[Tuple] = []
+        # Track timestamps to prevent duplicate entries
+        # Multiple calls cannot happen at the same exact timestamp
+        self.seen_timestamps: set = set()
 
-    return formatted_str
+    def start(self, tag, attrib):
+        if tag != "call":
+            return
+
+        # Bind per-record names once so the lookups below are locals
+        attrib_get = attrib.get
+
+        # Timestamps are kept as ints: set hashing and merge comparisons
+        # are faster than on strings, and ordering stays correct even if
+        # timestamp strings ever differ in width (string comparison is
+        # lexicographic). Records without a parseable timestamp are
+        # skipped. The int is rendered back to text by the CSV field
+        # encoder.
+        try:
+            call_timestamp = int(attrib_get("date", ""))
+        except ValueError:
+            return
+
+        # Skip if this call timestamp was already processed (deduplication)
+        if call_timestamp in self.seen_timestamps:
+            return
+
+        # Map call type code to readable name
+        call_type = CALL_TYPE_MAP.get(attrib_get("type", ""), "Unknown")
+
+        # Handle call duration
+        # Missed calls don't have duration, but incoming/outgoing calls
+        # may have duration of 0 if you hang up immediately. The call
+        # type is decided first so missed calls skip the duration work
+        # (attribute fetch, int conversion, formatting) entirely.
+        if call_type != "Missed":
+            # Store both raw seconds and human-readable format; sub-hour
+            # durations are a plain index into the precomputed table
+            call_duration_raw = attrib_get("duration", "0")
+            try:
+                duration_s = int(call_duration_raw)
+            except ValueError:
+                duration_s = -1
+            if 0 <= duration_s < _DURATION_TABLE_SIZE:
+                call_duration = _DURATION_STRINGS[duration_s]
+            else:
+                call_duration = get_human_readable_duration(call_duration_raw)
+        else:
+            # Missed calls: set duration fields to "N/A"
+            # All rows must have the same fields for the CSV writer
+            call_duration_raw = "N/A"
+            call_duration = "N/A"
+
+        # Extract additional metadata fields
+        # Read status: "1" = read, "0" = unread (if available)
+        read_status = attrib_get("read", "")
+
+        # SIM slot: subscription_id indicates which SIM card (for dual SIM)
+        subscription_id = attrib_get("subscription_id", "")
+
+        # Features: Additional call features (presentation, post_dial_digits, etc.)
+        features = []
+        presentation = attrib_get("presentation", "")
+        if presentation and presentation != "1":  # 1 is default/normal
+            features.append(f"presentation:{presentation}")
+
+        post_dial = attrib_get("post_dial_digits", "")
+        if post_dial:
+            features.append(f"post_dial:{post_dial}")
+
+        # Build the row tuple in CSV_HEADER order (minus "Call Id #")
+        call_entry = (
+            call_timestamp,
+            attrib_get("readable_date", ""),
+            call_type,
+            attrib_get("contact_name", "(Unknown)"),
+            attrib_get("number", ""),
+            call_duration_raw,
+            call_duration,
+            read_status if read_status else "N/A",
+            subscription_id if subscription_id else "N/A",
+            ", ".join(features) if features else "N/A",
+        )
+
+        # Mark this timestamp as processed
+        self.seen_timestamps.add(call_timestamp)
+        self.rows.append(call_entry)
+
+    def close(self):
+        rows = self.rows
+        # Reset so a reused target starts clean
+        self.rows = []
+        self.seen_timestamps = set()
+        return rows
+
+
+def _parse_calls_file(file_path: str) -> List[Tuple]:
+    """
+    Parse a single call backup XML file into sorted call row tuples.
+
+    Rows contain every CSV_HEADER column except the trailing "Call Id #",
+    which create_call_log assigns once rows from all files have been
+    merged. Duplicate timestamps within the file are dropped here;
+    cross-file duplicates are handled during the merge.
+
+    Kept at module level so it can be dispatched to worker processes when
+    multiple backup files are parsed in parallel.
+
+    Args:
+        file_path: Path to a single calls*.xml backup file
+
+    Returns:
+        List of call row tuples sorted by timestamp
+    """
+    # Event-driven parse through a target class: rows are assembled from
+    # the attribute dicts the C parser hands to _CallTarget.start, which
+    # avoids building (and then clearing) an Element per call record as
+    # iterparse would.
+    parser = lxml.etree.XMLParser(
+        target=_CallTarget(), huge_tree=True, recover=True
+    )
+    file_rows: List[Tuple] = lxml.etree.parse(file_path, parser)
+
+    # Backup files are usually already time-ordered, in which case this
+    # sort is a single linear pass (Timsort detects the sorted run)
+    file_rows.sort(key=itemgetter(0))
+    return file_rows
+
+
+def _parse_calls_file_to_spill(file_path: str) -> Optional[str]:
+    """
+    Parse one backup file and spill its sorted rows to a temp file.
+
+    Only one file's rows are ever held in memory at a time (inside the
+    worker, for the per-file sort); the parent process then merge-streams
+    the spill files into the final CSV without materializing the archive.
+
+    Args:
+        file_path: Path to a single calls*.xml backup file
+
+    Returns:
+        Path of the spill file holding the sorted rows, or None if the
+        backup file contained no call records
+    """
+    file_rows = _parse_calls_file(file_path)
+    if not file_rows:
+        return None
+
+    return row_spool.spill_rows(file_rows, suffix=".call_rows")
 
 
 def create_call_log(calls_xml_dir: str, output_dir: Optional[str] = None) -> None:
@@ -98,141 +339,34 @@ def create_call_log(calls_xml_dir: str, output_dir: Optional[str] = None) -> Non
         - Features: Additional call features (video call, HD, etc. when available)
         - Call Id #: Sequential call identifier
     """
-    all_calls_list = []
-
-    # Map Android call type codes to human-readable names
-    # Reference: https://developer.android.com/reference/android/provider/CallLog.Calls#TYPE
-    call_type_map = {
-        "1": "Incoming",
-        "2": "Outgoing",
-        "3": "Missed",
-        "4": "Voicemail",
-        "5": "Rejected",
-        "6": "Blocked",
-        "7": "AnsweredExternally",
-    }
-
-    # Track timestamps to prevent duplicate entries
-    # Multiple calls cannot happen at the same exact timestamp
-    call_timestamps = set()
-    call_timestamp_key_name = "Call Date (timestamp)"
-    num_calls = 0
-
     # Determine files to process - single file or all matching files in directory
-    files_to_process = []
-    if os.path.isfile(calls_xml_dir):
-        # Single file specified - use only that file if it matches pattern
-        if calls_xml_dir.endswith(".xml") and os.path.basename(calls_xml_dir).startswith("calls"):
-            files_to_process = [calls_xml_dir]
-        else:
-            print(f"Error: Input file '{calls_xml_dir}' does not match expected pattern (should be 'calls*.xml').")
-            return
-    elif os.path.isdir(calls_xml_dir):
-        # Directory specified - process all matching files
-        for filename in os.listdir(calls_xml_dir):
-            if not (filename.endswith(".xml") and filename.startswith("calls")):
-                continue
-            file_path = os.path.join(calls_xml_dir, filename)
-            files_to_process.append(file_path)
-    else:
-        print(f"Error: Input path is neither a file nor a directory: {calls_xml_dir}")
-        return
-
+    files_to_process = backup_file_finder.find_input_files(
+        calls_xml_dir, "calls", ".xml", "call backup XML"
+    )
     if not files_to_process:
-        print("No call backup XML files found to process.")
-        print("Please ensure your input path contains files matching 'calls*.xml' pattern.")
         return
 
-    # Process each call backup XML file
-    for file_path in files_to_process:
-
-        # Use iterparse for memory-efficient XML parsing
-        context = lxml.etree.iterparse(
-            file_path, events=("end",), huge_tree=True, recover=True
-        )
-
-        for event, elem in context:
-            if elem.tag != "call":
-                elem.clear()
-                continue
-
-            call_timestamp = elem.get("date", "")
-
-            # Skip if this call timestamp was already processed (deduplication)
-            if not call_timestamp or call_timestamp in call_timestamps:
-                elem.clear()
-                parent = elem.getparent()
-                if parent is not None:
-                    parent.remove(elem)
-                continue
+    # Copied backup folders often hold byte-identical files under
+    # different names; skip the copies instead of parsing them
+    files_to_process = backup_file_finder.skip_duplicate_files(files_to_process)
+
+    # Parse the backup files. The files are independent and parsing is
+    # CPU-bound (XML tokenization plus row construction), so multi-file
+    # backups fan out across cores; a single file is parsed in-process to
+    # avoid the worker startup cost. Each parse spills its sorted rows to
+    # a temp file and returns only the spill path, so the full archive is
+    # never resident in any one process.
+    if len(files_to_process) > 1:
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            spill_paths = list(
+                executor.map(_parse_calls_file_to_spill, files_to_process)
+            )
+    else:
+        spill_paths = [_parse_calls_file_to_spill(files_to_process[0])]
 
-            call_entry_obj = {}
-            call_entry_obj[call_timestamp_key_name] = call_timestamp
-            call_entry_obj["Call date"] = elem.get("readable_date", "")
-
-            # Map call type code to readable name
-            call_type_code = elem.get("type", "")
-            call_type = call_type_map.get(call_type_code, "Unknown")
-            call_entry_obj["Call type"] = call_type
-
-            call_entry_obj["Caller name"] = elem.get("contact_name", "(Unknown)")
-            call_entry_obj["Caller #"] = elem.get("number", "")
-
-            # Handle call duration
-            # Missed calls don't have duration, but incoming/outgoing calls
-            # may have duration of 0 if you hang up immediately
-            call_duration_raw = elem.get("duration", "0")
-
-            if call_type != "Missed":
-                # Store both raw seconds and human-readable format
-                call_entry_obj["Call duration (s)"] = call_duration_raw
-                call_entry_obj["Call duration"] = get_human_readable_duration(
-                    call_duration_raw
-                )
-            else:
-                # Missed calls: set duration fields to "N/A"
-                # All dictionaries must have the same keys for CSV writer
-                call_entry_obj["Call duration (s)"] = "N/A"
-                call_entry_obj["Call duration"] = "N/A"
-
-            # Extract additional metadata fields
-            # Read status: "1" = read, "0" = unread (if available)
-            read_status = elem.get("read", "")
-            call_entry_obj["Read status"] = read_status if read_status else "N/A"
-
-            # SIM slot: subscription_id indicates which SIM card (for dual SIM)
-            subscription_id = elem.get("subscription_id", "")
-            call_entry_obj["SIM slot"] = subscription_id if subscription_id else "N/A"
-
-            # Features: Additional call features (presentation, post_dial_digits, etc.)
-            features = []
-            presentation = elem.get("presentation", "")
-            if presentation and presentation != "1":  # 1 is default/normal
-                features.append(f"presentation:{presentation}")
-
-            post_dial = elem.get("post_dial_digits", "")
-            if post_dial:
-                features.append(f"post_dial:{post_dial}")
-
-            # Check for video call or other features (may be in other attributes)
-            # The XML may contain additional feature indicators in future versions
-            call_entry_obj["Features"] = ", ".join(features) if features else "N/A"
-
-            call_entry_obj["Call Id #"] = num_calls
-
-            # Mark this timestamp as processed
-            call_timestamps.add(call_timestamp)
-            all_calls_list.append(call_entry_obj)
-            num_calls += 1
-
-            # Free memory by clearing processed element
-            elem.clear()
-            parent = elem.getparent()
-            if parent is not None:
-                parent.remove(elem)
-
-        # Done parsing this file
-        del context
+    # One sorted spill file per input file that held any calls; the spill
+    # streams are merged with heapq.merge at write time
+    spill_paths = [spill_path for spill_path in spill_paths if spill_path]
 
     # Write call log to CSV file
     if output_dir is None:
@@ -246,29 +380,43 @@ def create_call_log(calls_xml_dir: str, output_dir: Optional[str] = None) -> Non
             print("  - The path is correct and writable")
             print("  - You have permission to create directories in the parent location")
             print("  - The path doesn't point to a read-only file system")
+            row_spool.remove_spill_files(spill_paths)
             return
 
     output_file = os.path.join(output_dir, "call_log.csv")
 
-    if not all_calls_list:
+    if not spill_paths:
         print("No calls found to export.")
         print("The input XML files do not contain any call records, or all calls were filtered out.")
         return
 
-    # Write CSV with proper newline handling for cross-platform compatibility
     num_records_written = 0
-    with open(output_file, "w", newline="") as csv_file_handle:
-        csv_writer = csv.writer(csv_file_handle)
-
-        # Write header row using keys from first call entry
-        csv_writer.writerow(all_calls_list[0].keys())
 
-        # Write call entries sorted by timestamp
-        for call_entry in sorted(
-            all_calls_list, key=lambda k: k[call_timestamp_key_name]
-        ):
-            csv_writer.writerow(list(call_entry.values()))
+    def merged_call_rows():
+        """Merge sorted spill streams, dedupe across files, assign call ids."""
+        nonlocal num_records_written
+        seen_timestamps = set()
+        spill_streams = [
+            row_spool.iter_spilled_rows(spill_path) for spill_path in spill_paths
+        ]
+        for row in heapq.merge(*spill_streams, key=itemgetter(0)):
+            call_timestamp = row[0]
+            if call_timestamp in seen_timestamps:
+                continue
+            seen_timestamps.add(call_timestamp)
+            yield row + (num_records_written,)
             num_records_written += 1
 
+    # Each spill file is already sorted, so heapq.merge streams the rows
+    # in timestamp order without building one big sorted copy; the direct
+    # bytes writer then emits them in buffered blocks. Memory stays
+    # constant regardless of archive size.
+    try:
+        with open(output_file, "wb") as csv_file_handle:
+            _write_csv_rows(csv_file_handle, [CSV_HEADER])
+            _write_csv_rows(csv_file_handle, merged_call_rows())
+    finally:
+        row_spool.remove_spill_files(spill_paths)
+
     print(f"Call log written to {output_file}")
     print(f"  - {num_records_written} call record(s) exported")
\ No newline at end of file
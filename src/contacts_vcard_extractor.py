@@ -9,11 +9,12 @@ Credits:
   Updated and upgraded v2 app: Rich Lewis - GitHub: @RichLewis007
 """
 
+import concurrent.futures
 import os
-import random
-import string
-from typing import Any, Callable, Dict, List, Tuple, Union
+import secrets
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+from . import backup_file_finder
 from . import vcf_field_parser
 from . import vcard_multimedia_helper
 
@@ -29,67 +30,86 @@ END_VCARD = "END:VCARD"
 RANDOM_FILENAME_LENGTH = 10
 
 
-# Field parser dispatch table - maps field prefixes to their parser functions
-FIELD_PARSERS: Dict[str, Callable[[str], Union[dict, tuple, str]]] = {
-    "ADR": vcf_field_parser.parse_address_tag,
-    "CATEGORIES": vcf_field_parser.parse_categories_tag,
-    "CLIENTPIDMAP": vcf_field_parser.parse_clientpidmap_tag,
-    "EMAIL": vcf_field_parser.parse_email_tag,
-    "GEO": vcf_field_parser.parse_geo_tag,
-    "IMPP": vcf_field_parser.parse_instant_messenger_handle_tag,
-    "LABEL": vcf_field_parser.parse_mailing_label_tag,
-    "MEMBER": vcf_field_parser.parse_member_tag,
-    "N": vcf_field_parser.parse_name_tag,
-    "ORG": vcf_field_parser.parse_organization_tag,
-    "RELATED": vcf_field_parser.parse_related_tag,
-    "TEL": vcf_field_parser.parse_telephone_tag,
-    "UID": vcf_field_parser.parse_uuid_tag,
+# Field parser dispatch table - maps field names to their parser
+# functions. The table lives alongside the parsers in vcf_field_parser;
+# this name is kept as the public alias for it.
+FIELD_PARSERS: Dict[str, Callable[[str], Union[dict, tuple, str]]] = (
+    vcf_field_parser.PARSERS
+)
+
+# Multimedia field names (PHOTO, SOUND, LOGO, KEY), as a frozenset so the
+# per-line membership test is a single hash probe
+_MULTIMEDIA_KEYS = vcard_multimedia_helper.ADVANCED_KEY_SET
+
+# Unified dispatch: field name -> parser. Every line is resolved with one
+# dict lookup on its leading field name instead of a startswith ladder
+# over the simple keys, FIELD_PARSERS, and multimedia keys in turn.
+_FIELD_DISPATCH: Dict[str, Callable[[str], Union[dict, tuple, str]]] = {
+    key: vcf_field_parser.parse_simple_tag for key in vcf_field_parser.SIMPLE_KEYS
 }
+_FIELD_DISPATCH.update(FIELD_PARSERS)
+
+
+def _field_name_of(file_line: str) -> str:
+    """
+    Extract the leading field name from a vCard line.
+
+    The field name is everything before the first ";" or ":", uppercased
+    (vCard property names are case-insensitive).
+    """
+    return (
+        file_line.split(vcf_field_parser.KEY_VALUE_SEPARATOR, 1)[0]
+        .split(vcf_field_parser.TAG_FIELD_SEPARATOR, 1)[0]
+        .upper()
+    )
 
 
-def parse_vcard_line(file_line: str) -> Dict[str, Any]:
+def parse_vcard_line(file_line: str, field_name: Optional[str] = None) -> Dict[str, Any]:
     """
     Parse a single vCard line and extract the property and value.
 
+    Dispatch is a single dict lookup on the leading field name rather
+    than a prefix scan over every known key per line.
+
     Args:
         file_line: A single line from a VCF file
+        field_name: The line's leading field name, when the caller has
+            already extracted it (the _parse_vcf_file loop computes it
+            once per line); derived from the line if omitted
 
     Returns:
         Dictionary containing the parsed field data
     """
     contact: Dict[str, Any] = {}
-
-    # Check for simple keys first (these don't require special parsing)
-    matching_key = next(
-        (key for key in vcf_field_parser.SIMPLE_KEYS if file_line.startswith(key)), None
-    )
-    if matching_key:
-        contact[matching_key] = vcf_field_parser.parse_simple_tag(file_line)
-        return contact
-
-    # Check dispatch table for standard field parsers
-    for field_prefix, parser_func in FIELD_PARSERS.items():
-        if file_line.startswith(field_prefix):
-            contact[field_prefix] = parser_func(file_line)
-            return contact
+    if field_name is None:
+        field_name = _field_name_of(file_line)
 
     # Handle multimedia fields (PHOTO, SOUND, LOGO, KEY)
     # These may span multiple lines
-    multimedia_keys = vcard_multimedia_helper.get_advanced_key_names()
-    for key in multimedia_keys:
-        if file_line.startswith(key):
-            # Remove tag name prefix before parsing (multimedia parser expects it removed)
-            tag_content = file_line[len(key) :]
-            contact[key] = vcf_field_parser.parse_multimedia_tag(tag_content)
-            return contact
+    if field_name in _MULTIMEDIA_KEYS:
+        # Remove tag name prefix before parsing (multimedia parser expects it removed)
+        tag_content = file_line[len(field_name) :]
+        contact[field_name] = vcf_field_parser.parse_multimedia_tag(tag_content)
+        return contact
+
+    parser_func = _FIELD_DISPATCH.get(field_name)
+    if parser_func is not None:
+        contact[field_name] = parser_func(file_line)
 
     # Unknown field - return empty dict (some fields may be ignored)
     return contact
 
 
 def _generate_random_filename() -> str:
-    """Generate a random filename for contacts without names."""
-    return "".join(random.sample(string.ascii_letters, RANDOM_FILENAME_LENGTH))
+    """
+    Generate a random filename for contacts without names.
+
+    secrets.token_hex draws straight from the OS CSPRNG — no Mersenne
+    Twister seeding or Python-level sampling — and, unlike sampling
+    letters without replacement, repeated characters are allowed, so
+    collisions between anonymous contacts are less likely.
+    """
+    return secrets.token_hex(RANDOM_FILENAME_LENGTH // 2)
 
 
 def _get_contact_identifier(contact: Dict) -> str:
@@ -113,51 +133,62 @@ def _get_contact_identifier(contact: Dict) -> str:
     return _generate_random_filename()
 
 
-def generate_multimedia_of_contact(contact: Dict, output_dir: str) -> None:
+def generate_multimedia_of_contact(
+    contact: Dict, output_dir: str, url_queue: Optional[list] = None
+) -> None:
     """
     Extract and save multimedia content from a contact.
 
     Args:
         contact: Dictionary containing contact data
         output_dir: Directory where multimedia files should be saved
+        url_queue: Optional list collecting URL-based media for a batch
+            download after parsing (see _parse_vcf_file)
     """
     base_filename = _get_contact_identifier(contact)
     output_path = os.path.join(output_dir, base_filename)
-    vcard_multimedia_helper.extract_key_multimedia(contact, output_path)
+    vcard_multimedia_helper.extract_key_multimedia(contact, output_path, url_queue)
 
 
 def _parse_multiline_multimedia(
-    vcf_file_lines: List[str], start_line: int
-) -> Tuple[str, int]:
+    first_line: str, line_iterator: Iterator[str]
+) -> Tuple[str, Optional[str], int]:
     """
     Parse a multimedia field that may span multiple lines.
 
+    Continuation lines are consumed from the iterator until a blank line
+    or a line containing a colon marks the start of the next field; that
+    line is handed back to the caller for normal processing instead of
+    being lost.
+
     Args:
-        vcf_file_lines: List of all lines in the VCF file
-        start_line: Index of the first line of the multimedia field
+        first_line: The line the multimedia field starts on
+        line_iterator: Iterator yielding the remaining file lines
 
     Returns:
-        Tuple of (concatenated multimedia tag line, next line index)
+        Tuple of (concatenated multimedia tag line, the lookahead line
+        that ended the field or None at end of file, number of lines
+        consumed from the iterator)
     """
-    multimedia_tag_line = vcf_file_lines[start_line].strip()
-    next_line_num = start_line + 1
+    # Collect stripped continuation chunks and join once at the end;
+    # repeated str += would copy the growing base64 payload per line
+    tag_line_parts = [first_line.strip()]
+    lines_consumed = 0
 
     # Continue reading lines until we find a colon (end of multiline field)
-    while next_line_num < len(vcf_file_lines):
-        next_line = vcf_file_lines[next_line_num]
+    for next_line in line_iterator:
+        lines_consumed += 1
+        stripped = next_line.strip()
 
-        # Empty line means done parsing
-        if not next_line.strip():
-            break
+        # Empty line or a line with a colon means done parsing; hand the
+        # line back so the main loop processes it. Both tests run in C
+        # ("in" is a memchr-style scan).
+        if not stripped or ":" in next_line:
+            return "".join(tag_line_parts), next_line, lines_consumed
 
-        # If line contains colon, we've reached the end
-        if ":" in next_line:
-            break
+        tag_line_parts.append(stripped)
 
-        multimedia_tag_line += next_line.strip()
-        next_line_num += 1
-
-    return multimedia_tag_line.strip(), next_line_num
+    return "".join(tag_line_parts), None, lines_consumed
 
 
 def _parse_vcf_file(file_path: str, output_media_dir: str) -> List[Dict]:
@@ -173,70 +204,92 @@ def _parse_vcf_file(file_path: str, output_media_dir: str) -> List[Dict]:
     """
     all_contacts = []
 
-    with open(file_path, "r", encoding="utf-8") as vcf_file:
-        vcf_file_lines = vcf_file.readlines()
+    # URL-based media is queued during parsing and downloaded in one
+    # concurrent batch afterwards, so network waits overlap instead of
+    # blocking the parse one request at a time
+    url_downloads: List[Tuple[str, str]] = []
 
     curr_contact: Dict[str, Any] = {}
     currently_in_contact = False
     has_multimedia = False
     line_num = 0
+    # One-slot lookahead buffer: the line that terminated a multiline
+    # multimedia field is replayed here instead of being lost
+    pending_line: Optional[str] = None
 
-    while line_num < len(vcf_file_lines):
-        line_content = vcf_file_lines[line_num]
-        stripped_line = line_content.strip()
-
-        if stripped_line == BEGIN_VCARD:
-            if currently_in_contact:
-                raise ValueError(
-                    f"Missing END:VCARD tag before new BEGIN:VCARD at line {line_num + 1}"
-                )
-            currently_in_contact = True
-            curr_contact = {}
-            has_multimedia = False
-
-        elif stripped_line == END_VCARD:
-            if not currently_in_contact:
-                raise ValueError(
-                    f"Found END:VCARD without matching BEGIN:VCARD at line {line_num + 1}"
-                )
-
-            currently_in_contact = False
-            all_contacts.append(curr_contact)
-
-            # Extract multimedia if present
-            if has_multimedia:
-                generate_multimedia_of_contact(curr_contact, output_media_dir)
-
-            # Reset for next contact
-            curr_contact = {}
-            has_multimedia = False
-
-        elif currently_in_contact:
-            # Check if this is a multiline multimedia field
-            multimedia_keys = vcard_multimedia_helper.get_advanced_key_names()
-            if any(line_content.startswith(key) for key in multimedia_keys):
-                has_multimedia = True
-                multimedia_tag_line, next_line_num = _parse_multiline_multimedia(
-                    vcf_file_lines, line_num
-                )
-
-                new_contact_info = parse_vcard_line(multimedia_tag_line)
+    # Stream the file line by line; only the current line (plus the
+    # accumulating multimedia tag, when one is open) is ever in memory,
+    # rather than the whole file as a list of str objects
+    with open(file_path, "r", encoding="utf-8") as vcf_file:
+        while True:
+            if pending_line is not None:
+                line_content = pending_line
+                pending_line = None
+            else:
+                line_content = next(vcf_file, None)
+                if line_content is None:
+                    break
+                line_num += 1
+
+            stripped_line = line_content.strip()
+
+            if stripped_line == BEGIN_VCARD:
+                if currently_in_contact:
+                    raise ValueError(
+                        f"Missing END:VCARD tag before new BEGIN:VCARD at line {line_num}"
+                    )
+                currently_in_contact = True
+                curr_contact = {}
+                has_multimedia = False
+
+            elif stripped_line == END_VCARD:
+                if not currently_in_contact:
+                    raise ValueError(
+                        f"Found END:VCARD without matching BEGIN:VCARD at line {line_num}"
+                    )
+
+                currently_in_contact = False
+                all_contacts.append(curr_contact)
+
+                # Extract multimedia if present
+                if has_multimedia:
+                    generate_multimedia_of_contact(
+                        curr_contact, output_media_dir, url_downloads
+                    )
+
+                # Reset for next contact
+                curr_contact = {}
+                has_multimedia = False
+
+            elif currently_in_contact:
+                # The field name is extracted once here and passed down,
+                # so parse_vcard_line doesn't re-split the same prefix
+                field_name = _field_name_of(stripped_line)
+
+                # Check if this is a multiline multimedia field
+                if field_name in _MULTIMEDIA_KEYS:
+                    has_multimedia = True
+                    multimedia_tag_line, pending_line, lines_consumed = (
+                        _parse_multiline_multimedia(line_content, vcf_file)
+                    )
+                    line_num += lines_consumed
+
+                    new_contact_info = parse_vcard_line(multimedia_tag_line, field_name)
+                    if new_contact_info:
+                        curr_contact.update(new_contact_info)
+                    continue
+
+                # Parse regular single-line field
+                new_contact_info = parse_vcard_line(stripped_line, field_name)
                 if new_contact_info:
                     curr_contact.update(new_contact_info)
 
-                line_num = next_line_num
-                continue
-
-            # Parse regular single-line field
-            new_contact_info = parse_vcard_line(stripped_line)
-            if new_contact_info:
-                curr_contact.update(new_contact_info)
-
-        line_num += 1
-
     if currently_in_contact:
         raise ValueError("File ended without closing END:VCARD tag")
 
+    # Drain the queued URL downloads concurrently
+    vcard_multimedia_helper.download_multimedia_urls(url_downloads)
+
     return all_contacts
 
 
@@ -269,37 +322,40 @@ def parse_contacts_from_vcf_files(vcf_files_dir: str, output_media_dir: str) ->
     all_contacts = []
 
     # Determine files to process - single file or all matching files in directory
-    files_to_process = []
-    if os.path.isfile(vcf_files_dir):
-        # Single file specified - use only that file if it matches pattern
-        if vcf_files_dir.endswith(".vcf"):
-            files_to_process = [vcf_files_dir]
-        else:
-            print(f"Error: Input file '{vcf_files_dir}' does not match expected pattern (should end with '.vcf').")
-            return
-    elif os.path.isdir(vcf_files_dir):
-        # Directory specified - process all matching files
-        for filename in os.listdir(vcf_files_dir):
-            if not filename.endswith(".vcf"):
-                continue
-            file_path = os.path.join(vcf_files_dir, filename)
-            files_to_process.append(file_path)
-    else:
-        print(f"Error: Input path is neither a file nor a directory: {vcf_files_dir}")
+    files_to_process = backup_file_finder.find_input_files(
+        vcf_files_dir, "", ".vcf", "VCF/vCard"
+    )
+    if not files_to_process:
         return
 
-    for file_path in files_to_process:
-
+    def collect_result(file_path: str, get_contacts: Callable[[], List[Dict]]) -> None:
+        """Collect one file's contacts, reporting parse failures per file."""
         try:
-            contacts = _parse_vcf_file(file_path, output_media_dir)
+            contacts = get_contacts()
             all_contacts.extend(contacts)
             print(f"Parsed {os.path.basename(file_path)}: {len(contacts)} contact(s) found")
         except ValueError as e:
-            print(f"Error parsing {filename}: {e}")
-            continue
+            print(f"Error parsing {os.path.basename(file_path)}: {e}")
         except Exception as e:
-            print(f"Unexpected error parsing {filename}: {e}")
-            continue
+            print(f"Unexpected error parsing {os.path.basename(file_path)}: {e}")
+
+    # The files are independent (separate contacts, multimedia filenames
+    # derived from contact names), so multi-file exports fan out across
+    # cores; a single file is parsed in-process to avoid worker startup
+    # cost. Multimedia extraction happens inside the workers, which is
+    # where most of the decode and file I/O time is spent.
+    if len(files_to_process) > 1:
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            future_to_path = {
+                executor.submit(_parse_vcf_file, file_path, output_media_dir): file_path
+                for file_path in files_to_process
+            }
+            for future in concurrent.futures.as_completed(future_to_path):
+                file_path = future_to_path[future]
+                collect_result(file_path, future.result)
+    else:
+        file_path = files_to_process[0]
+        collect_result(file_path, lambda: _parse_vcf_file(file_path, output_media_dir))
 
     if not all_contacts:
         print("No contacts found in VCF files.")
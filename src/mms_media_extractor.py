@@ -27,6 +27,8 @@ import time
 
 import lxml.etree
 
+from . import backup_file_finder
+
 # Filesystem constraints
 MAX_FILENAME_LENGTH = 200
 MAX_FULLPATH_LENGTH = 252  # Common filesystem limit (e.g., Windows)
@@ -220,6 +222,13 @@ def reconstruct_mms_media(
     start_time = time.time()
     orig_files_count = 0
 
+    # Determine files to process - single file or all matching files in directory
+    files_to_process = backup_file_finder.find_input_files(
+        sms_xml_dir, "sms", ".xml", "SMS backup XML"
+    )
+    if not files_to_process:
+        return
+
     # Build status message showing which media types are being processed
     media_types = []
     if process_image:
@@ -234,31 +243,6 @@ def reconstruct_mms_media(
     content_msg = f"Processing messages ({', '.join(media_types)})..."
     print(content_msg, end="", flush=True)
 
-    # Determine files to process - single file or all matching files in directory
-    files_to_process = []
-    if os.path.isfile(sms_xml_dir):
-        # Single file specified - use only that file if it matches pattern
-        if sms_xml_dir.endswith(".xml") and os.path.basename(sms_xml_dir).startswith("sms"):
-            files_to_process = [sms_xml_dir]
-        else:
-            print(f"\nError: Input file '{sms_xml_dir}' does not match expected pattern (should be 'sms*.xml').")
-            return
-    elif os.path.isdir(sms_xml_dir):
-        # Directory specified - process all matching files
-        for filename in os.listdir(sms_xml_dir):
-            if not (filename.endswith(".xml") and filename.startswith("sms")):
-                continue
-            file_path = os.path.join(sms_xml_dir, filename)
-            files_to_process.append(file_path)
-    else:
-        print(f"Error: Input path is neither a file nor a directory: {sms_xml_dir}")
-        return
-
-    if not files_to_process:
-        print("\nNo SMS backup XML files found to process.")
-        print("Please ensure your input path contains files matching 'sms*.xml' pattern.")
-        return
-
     # Process each SMS backup XML file
     for file_path in files_to_process:
 
@@ -383,17 +367,18 @@ def reconstruct_mms_media(
     num_final_files = 0
     
     if os.path.exists(output_media_dir):
-        for filename in os.listdir(output_media_dir):
-            file_path = os.path.join(output_media_dir, filename)
-            if os.path.isfile(file_path):
-                num_final_files += 1
-                file_size = os.path.getsize(file_path)
-                total_size += file_size
-                
-                # Get file extension
-                _, ext = os.path.splitext(filename)
-                ext = ext.lower() if ext else "no extension"
-                file_types[ext] = file_types.get(ext, 0) + 1
+        # scandir DirEntry objects carry cached stat info, so the
+        # is_file/size checks don't need an extra stat per entry
+        with os.scandir(output_media_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    num_final_files += 1
+                    total_size += entry.stat().st_size
+
+                    # Get file extension
+                    _, ext = os.path.splitext(entry.name)
+                    ext = ext.lower() if ext else "no extension"
+                    file_types[ext] = file_types.get(ext, 0) + 1
     
     end_time = time.time()
     
@@ -446,20 +431,24 @@ def remove_duplicate_files(output_media_dir: str) -> int:
 
     print("Removing duplicates...", end="", flush=True)
 
-    for filename in os.listdir(output_media_dir):
-        file_path = os.path.join(output_media_dir, filename)
+    # scandir avoids the join + stat per entry that listdir would need;
+    # the entries are snapshotted up front because files are removed from
+    # the directory while we work through it
+    with os.scandir(output_media_dir) as scandir_iter:
+        entries = list(scandir_iter)
 
-        if not os.path.isfile(file_path):
-            print(f"\nERROR: Subdirectory found in output directory: {filename}")
+    for entry in entries:
+        if not entry.is_file():
+            print(f"\nERROR: Subdirectory found in output directory: {entry.name}")
             sys.exit(1)
 
         # Calculate file hash
-        with open(file_path, "rb") as f:
+        with open(entry.path, "rb") as f:
             file_hash = hashlib.md5(f.read()).hexdigest()
 
         # Remove if duplicate or empty
-        if file_hash in unique_hashes or os.path.getsize(file_path) == 0:
-            os.remove(file_path)
+        if file_hash in unique_hashes or entry.stat().st_size == 0:
+            os.remove(entry.path)
             duplicate_files_count += 1
         else:
             unique_hashes.add(file_hash)
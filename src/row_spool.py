@@ -0,0 +1,53 @@
+"""
+Sorted-row spill files for merge-streaming CSV exporters.
+
+The exporters sort each input file's rows, spill them to a pickle temp
+file, and heap-merge the spill streams into the final CSV at write time.
+That keeps peak memory bounded by the largest single input file instead
+of the whole archive, and the merge consumes one row at a time.
+"""
+
+import os
+import pickle
+import tempfile
+from typing import Iterable, Iterator, Sequence, Tuple
+
+
+def spill_rows(rows: Iterable[Tuple], suffix: str = ".rows") -> str:
+    """
+    Spill an iterable of row tuples to a temp file, preserving order.
+
+    Args:
+        rows: Row tuples to spill (already sorted by the caller)
+        suffix: Temp file suffix, useful when inspecting stray files
+
+    Returns:
+        Path of the spill file; pass it to iter_spilled_rows to read the
+        rows back, and to remove_spill_files when done
+    """
+    spill_file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+    with spill_file:
+        pickler = pickle.Pickler(spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+        for row in rows:
+            pickler.dump(row)
+    return spill_file.name
+
+
+def iter_spilled_rows(spill_path: str) -> Iterator[Tuple]:
+    """Yield the row tuples previously spilled to the given temp file."""
+    with open(spill_path, "rb") as spill_file:
+        unpickler = pickle.Unpickler(spill_file)
+        while True:
+            try:
+                yield unpickler.load()
+            except EOFError:
+                return
+
+
+def remove_spill_files(spill_paths: Sequence[str]) -> None:
+    """Delete spill files, ignoring ones already gone."""
+    for spill_path in spill_paths:
+        try:
+            os.remove(spill_path)
+        except OSError:
+            pass
@@ -11,10 +11,69 @@ Credits:
 """
 
 import csv
+import heapq
 import os
+from collections import namedtuple
+from operator import itemgetter
 
 import lxml.etree
 
+from . import backup_file_finder
+from . import row_spool
+
+# CSV column order for message output. Rows are built as Message tuples
+# in this exact order and handed to csv.writer.writerows in one call,
+# instead of one dict per message and a writerow per row.
+CSV_HEADER = (
+    "Message Type",
+    "Date (timestamp)",
+    "Date",
+    "Address",
+    "Contact Name",
+    "Type",
+    "Body",
+    "Read",
+    "Status",
+    "Locked",
+    "SIM ID",
+    "Message ID",
+)
+
+# One message row, with fields matching CSV_HEADER. A namedtuple has the
+# memory footprint of a plain tuple (no per-row dict of interned keys)
+# while keeping the fields readable at the construction sites, and it
+# iterates to its values directly so writerows consumes it as-is.
+Message = namedtuple(
+    "Message",
+    (
+        "message_type",
+        "timestamp",
+        "date",
+        "address",
+        "contact_name",
+        "msg_type",
+        "body",
+        "read",
+        "status",
+        "locked",
+        "sim_id",
+        "message_id",
+    ),
+)
+
+
+def _timestamp_of(raw_timestamp: str) -> int:
+    """
+    Parse a message date attribute to int for numeric sorting.
+
+    Messages with a missing or malformed date sort to the front (0)
+    instead of being dropped.
+    """
+    try:
+        return int(raw_timestamp)
+    except ValueError:
+        return 0
+
 
 def extract_sms_messages(sms_xml_dir: str, output_dir: str) -> None:
     """
@@ -27,8 +86,6 @@ def extract_sms_messages(sms_xml_dir: str, output_dir: str) -> None:
         sms_xml_dir: Directory containing SMS backup XML files, or a single XML file path
         output_dir: Directory where sms_messages.csv will be written
     """
-    all_messages = []
-
     if not os.path.exists(sms_xml_dir):
         print(f"Error: Input path does not exist: {sms_xml_dir}")
         print("Please provide a valid directory or file path containing SMS backup XML files.")
@@ -47,128 +104,125 @@ def extract_sms_messages(sms_xml_dir: str, output_dir: str) -> None:
     num_mms_text = 0
 
     # Determine files to process - single file or all matching files in directory
-    files_to_process = []
-    if os.path.isfile(sms_xml_dir):
-        # Single file specified - use only that file if it matches pattern
-        if sms_xml_dir.endswith(".xml") and os.path.basename(sms_xml_dir).startswith("sms"):
-            files_to_process = [sms_xml_dir]
-        else:
-            print(f"Error: Input file '{sms_xml_dir}' does not match expected pattern (should be 'sms*.xml').")
-            return
-    elif os.path.isdir(sms_xml_dir):
-        # Directory specified - process all matching files
-        for filename in os.listdir(sms_xml_dir):
-            if not (filename.endswith(".xml") and filename.startswith("sms")):
-                continue
-            file_path = os.path.join(sms_xml_dir, filename)
-            files_to_process.append(file_path)
-    else:
-        print(f"Error: Input path is neither a file nor a directory: {sms_xml_dir}")
-        return
-
+    files_to_process = backup_file_finder.find_input_files(
+        sms_xml_dir, "sms", ".xml", "SMS backup XML"
+    )
     if not files_to_process:
-        print("No SMS backup XML files found to process.")
-        print("Please ensure your input path contains files matching 'sms*.xml' pattern.")
         return
 
+    # One sorted spill file per input file that held any messages; the
+    # spill streams are merged at write time so the full archive is never
+    # resident in memory at once
+    spill_paths = []
+
     # Process each SMS backup XML file
     for file_path in files_to_process:
 
-        # Use iterparse for memory-efficient XML parsing
+        file_messages = []
+
+        # Use iterparse for memory-efficient XML parsing. The tag filter
+        # restricts end events to top-level <sms> and <mms> records; the
+        # parts of an MMS are walked from its complete element below, so
+        # no per-<part> events or getparent() hops are needed.
         context = lxml.etree.iterparse(
-            file_path, events=("end",), huge_tree=True, recover=True
+            file_path, events=("end",), tag=("sms", "mms"), huge_tree=True, recover=True
         )
 
         for event, elem in context:
-            message_entry = {}
-
             # Process SMS messages
             if elem.tag == "sms":
-                message_entry["Message Type"] = "SMS"
-                message_entry["Date (timestamp)"] = elem.get("date", "")
-                message_entry["Date"] = elem.get("readable_date", "")
-                message_entry["Address"] = elem.get("address", "")
-                message_entry["Contact Name"] = elem.get("contact_name", "")
-                message_entry["Type"] = elem.get("type", "")  # 1=incoming, 2=outgoing
-                message_entry["Body"] = elem.get("body", "")
-                message_entry["Read"] = elem.get("read", "")
-                message_entry["Status"] = elem.get("status", "")
-                message_entry["Locked"] = elem.get("locked", "")
-                message_entry["SIM ID"] = elem.get("sub_id", "")
-                message_entry["Message ID"] = str(num_sms)
-
-                if message_entry["Body"]:  # Only add if body exists
-                    all_messages.append(message_entry)
+                body = elem.get("body", "")
+                if body:  # Only add if body exists
+                    # The timestamp is parsed to int once here so the
+                    # final sort compares integers instead of strings
+                    file_messages.append(
+                        Message(
+                            message_type="SMS",
+                            timestamp=_timestamp_of(elem.get("date", "")),
+                            date=elem.get("readable_date", ""),
+                            address=elem.get("address", ""),
+                            contact_name=elem.get("contact_name", ""),
+                            msg_type=elem.get("type", ""),  # 1=incoming, 2=outgoing
+                            body=body,
+                            read=elem.get("read", ""),
+                            status=elem.get("status", ""),
+                            locked=elem.get("locked", ""),
+                            sim_id=elem.get("sub_id", ""),
+                            message_id=num_sms,
+                        )
+                    )
                     num_sms += 1
 
             # Process MMS text bodies
-            elif elem.tag == "part":
-                # Check if this is a text/plain part
-                content_type = elem.get("ct", "").lower()
-                if content_type == "text/plain":
-                    # Get parent MMS node for metadata
-                    parent_parts = elem.getparent()  # <parts>
-                    if parent_parts is not None:
-                        mms_node = parent_parts.getparent()  # <mms>
-                        if mms_node is not None:
-                            text_body = elem.get("text", "")
-                            if text_body:  # Only add if text body exists
-                                mms_message_entry = {}
-                                mms_message_entry["Message Type"] = "MMS"
-                                mms_message_entry["Date (timestamp)"] = mms_node.get(
-                                    "date", ""
-                                )
-                                mms_message_entry["Date"] = mms_node.get(
-                                    "readable_date", ""
-                                )
-                                mms_message_entry["Address"] = mms_node.get(
-                                    "address", ""
-                                )
-                                mms_message_entry["Contact Name"] = mms_node.get(
-                                    "contact_name", ""
-                                )
-                                mms_message_entry["Type"] = mms_node.get("m_type", "")
-                                mms_message_entry["Body"] = text_body
-                                mms_message_entry["Read"] = mms_node.get("read", "")
-                                mms_message_entry["Status"] = mms_node.get("st", "")
-                                mms_message_entry["Locked"] = mms_node.get("locked", "")
-                                mms_message_entry["SIM ID"] = mms_node.get("sub_id", "")
-                                mms_message_entry["Message ID"] = str(num_mms_text)
-
-                                all_messages.append(mms_message_entry)
-                                num_mms_text += 1
-
-            # Free memory by clearing processed element
+            else:
+                # Walk the complete <mms> element for text/plain parts
+                # (elem.iter runs in C)
+                for part in elem.iter("part"):
+                    if part.get("ct", "").lower() != "text/plain":
+                        continue
+                    text_body = part.get("text", "")
+                    if text_body:  # Only add if text body exists
+                        file_messages.append(
+                            Message(
+                                message_type="MMS",
+                                timestamp=_timestamp_of(elem.get("date", "")),
+                                date=elem.get("readable_date", ""),
+                                address=elem.get("address", ""),
+                                contact_name=elem.get("contact_name", ""),
+                                msg_type=elem.get("m_type", ""),
+                                body=text_body,
+                                read=elem.get("read", ""),
+                                status=elem.get("st", ""),
+                                locked=elem.get("locked", ""),
+                                sim_id=elem.get("sub_id", ""),
+                                message_id=num_mms_text,
+                            )
+                        )
+                        num_mms_text += 1
+
+            # Free memory with the fast_iter cleanup idiom: clear the
+            # record once it is processed and delete already-processed
+            # preceding siblings, which keeps cleanup amortized O(N)
+            # (removing each element from its parent is O(siblings) per
+            # call) and bounds the live tree to the current record
             elem.clear()
             parent = elem.getparent()
             if parent is not None:
-                parent.remove(elem)
+                while elem.getprevious() is not None:
+                    del parent[0]
 
         # Done parsing this file
         del context
 
+        # Sort this file's rows by timestamp (an int comparison on the
+        # row tuples) and spill them; only one file's rows are ever in
+        # memory at a time
+        if file_messages:
+            file_messages.sort(key=itemgetter(1))
+            spill_paths.append(row_spool.spill_rows(file_messages, suffix=".sms_rows"))
+
     # Write messages to CSV file
     output_file = os.path.join(output_dir, "sms_messages.csv")
 
-    if not all_messages:
+    if not spill_paths:
         print("No SMS messages or MMS text bodies found to export.")
         print("The input XML files do not contain any SMS messages or MMS text content.")
         return
 
-    # Write CSV with proper newline handling for cross-platform compatibility
-    with open(output_file, "w", newline="", encoding="utf-8") as csv_file_handle:
-        csv_writer = csv.writer(csv_file_handle)
-
-        # Write header row using keys from first message entry
-        csv_writer.writerow(all_messages[0].keys())
-
-        # Write message entries sorted by timestamp
-        for message in sorted(
-            all_messages, key=lambda k: k.get("Date (timestamp)", "")
-        ):
-            # Ensure all values are strings and handle None values
-            row = [str(v) if v is not None else "" for v in message.values()]
-            csv_writer.writerow(row)
+    # Write CSV with proper newline handling for cross-platform
+    # compatibility. heapq.merge streams the sorted spill files in global
+    # timestamp order one row at a time, and writerows keeps the per-row
+    # loop inside the csv module's C code.
+    try:
+        with open(output_file, "w", newline="", encoding="utf-8") as csv_file_handle:
+            csv_writer = csv.writer(csv_file_handle)
+            csv_writer.writerow(CSV_HEADER)
+            spill_streams = [
+                row_spool.iter_spilled_rows(spill_path) for spill_path in spill_paths
+            ]
+            csv_writer.writerows(heapq.merge(*spill_streams, key=itemgetter(1)))
+    finally:
+        row_spool.remove_spill_files(spill_paths)
 
     print(f"SMS messages exported to {output_file}")
     print(f"  - {num_sms} SMS messages")
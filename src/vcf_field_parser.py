@@ -9,7 +9,10 @@ vCard format uses semicolons (;) as field separators and colons (:) as
 key-value separators. Some fields may span multiple lines.
 """
 
+import re
+import sys
 import typing
+from functools import lru_cache
 
 from . import vcard_multimedia_helper
 
@@ -20,7 +23,9 @@ TYPE_ASSIGNMENT_OR_LABEL_SEPARATOR = "="  # Used in TYPE=value constructs
 
 # Simple keys that don't require special parsing - just key:value pairs
 # Examples: ANNIVERSARY:19901021, FN:Dr. John Doe, GENDER:F
-SIMPLE_KEYS = [
+# A frozenset so per-line membership tests are a single hash lookup
+# rather than a scan over the key names.
+SIMPLE_KEYS = frozenset({
     "AGENT",
     "ANNIVERSARY",
     "BDAY",
@@ -46,15 +51,38 @@ SIMPLE_KEYS = [
     "URL",
     "VERSION",
     "XML",
+})
+
+# Subkey names for the structured N and ORG tags, interned once at
+# module load: they become dict keys on every parsed contact, and
+# interned keys hash and compare by pointer identity.
+_NAME_SUBKEY_TYPES = [
+    sys.intern(key)
+    for key in (
+        "family_name",
+        "given_name",
+        "additional_middle_names",
+        "honorific_prefixes",
+        "honorific_suffixes",
+    )
+]
+_ORG_SUBKEY_TYPES = [
+    sys.intern(key)
+    for key in (
+        "organization_name",
+        "collective_organization_name",
+        "organizational_unit_name",
+    )
 ]
 
 
+@lru_cache(maxsize=4096)
 def parse_simple_tag(file_line: str) -> str:
     """
     Parse a simple vCard tag (key:value format).
 
     Handles cases where the value contains colons (e.g., URLs).
-    Splits on the first colon and joins everything after it.
+    Partitions on the first colon and returns the tail.
 
     Args:
         file_line: vCard line in format "KEY:value" or "KEY:value:with:colons"
@@ -68,9 +96,13 @@ def parse_simple_tag(file_line: str) -> str:
         >>> parse_simple_tag("URL:http://example.com/path")
         'http://example.com/path'
     """
-    # Split on colon and join everything after the first one
-    # This handles URLs and other values with multiple colons
-    return "".join(file_line.split(KEY_VALUE_SEPARATOR)[1:])
+    # Memoized: address books repeat values heavily (same VERSION line
+    # per contact, shared org names and URLs), and the str result is
+    # immutable so the cached object can be shared
+    # partition scans once and returns the tail as a single slice —
+    # no list of colon-delimited substrings — and, unlike the previous
+    # split-and-join, it preserves the colons inside URL values
+    return file_line.partition(KEY_VALUE_SEPARATOR)[2]
 
 
 def parse_address_tag(address_line: str) -> dict:
@@ -87,35 +119,32 @@ def parse_address_tag(address_line: str) -> dict:
         Dictionary with address type as key and address string as value
         Example: {"HOME": "123 Main St City State 12345 USA"}
     """
-    addr_line_split = address_line.split(TAG_FIELD_SEPARATOR)
-
-    # Extract address components by iterating backwards until we hit the colon
-    address_components_reverse = []
-    for elem in addr_line_split[::-1]:
-        if KEY_VALUE_SEPARATOR in elem:
-            break
-        address_components_reverse.append(elem)
-
-    # Reverse to get correct order and join
-    address = " ".join(address_components_reverse[::-1])
+    # Everything after the colon is the address; everything before it
+    # carries the type. One partition replaces the old reverse-scan-reverse
+    # over the full field list (two list copies plus a Python loop).
+    head, _, tail = address_line.partition(KEY_VALUE_SEPARATOR)
+    components = [c for c in tail.split(TAG_FIELD_SEPARATOR) if c]
+    address = " ".join(components).strip()
 
     # Extract address type (HOME, WORK, etc.)
     address_type = ""
-    if len(addr_line_split) > 1:
-        if addr_line_split[1].startswith("TYPE"):
+    head_parts = head.split(TAG_FIELD_SEPARATOR)
+    if len(head_parts) > 1:
+        if head_parts[1].startswith("TYPE"):
             # Format: TYPE=HOME
-            address_type = (
-                addr_line_split[1]
-                .split(TYPE_ASSIGNMENT_OR_LABEL_SEPARATOR)[1]
-                .split(KEY_VALUE_SEPARATOR)[0]
-            )
+            address_type = head_parts[1].split(
+                TYPE_ASSIGNMENT_OR_LABEL_SEPARATOR, 1
+            )[1]
         else:
             # Format: HOME (without TYPE= prefix)
-            address_type = addr_line_split[1]
+            address_type = head_parts[1]
 
-    return {address_type: address.strip()}
+    # TYPE tokens ("HOME", "WORK", ...) recur across contacts and become
+    # dict keys downstream; interning shares one object per token
+    return {sys.intern(address_type): address}
 
 
+@lru_cache(maxsize=4096)
 def parse_categories_tag(category_line: str) -> tuple:
     """
     Parse a CATEGORIES tag from a vCard.
@@ -133,7 +162,7 @@ def parse_categories_tag(category_line: str) -> tuple:
         ('biker', 'swimmer')
     """
     # Extract value and split by comma, then sort
-    value = "".join(category_line.split(KEY_VALUE_SEPARATOR)[1:])
+    value = category_line.partition(KEY_VALUE_SEPARATOR)[2]
     return tuple(sorted(value.split(",")))
 
 
@@ -149,9 +178,9 @@ def parse_clientpidmap_tag(clientpidmap_line: str) -> dict:
     Returns:
         Dictionary mapping PID source identifier to URN
     """
-    clientpidmap_split = clientpidmap_line.split(TAG_FIELD_SEPARATOR)
+    clientpidmap_split = clientpidmap_line.split(TAG_FIELD_SEPARATOR, 1)
     urn = clientpidmap_split[1]
-    pid_source_identifier = clientpidmap_split[0].split(KEY_VALUE_SEPARATOR)[1]
+    pid_source_identifier = clientpidmap_split[0].split(KEY_VALUE_SEPARATOR, 1)[1]
     return {pid_source_identifier: urn}
 
 
@@ -183,16 +212,18 @@ def parse_geo_tag(geo_line: str) -> dict:
     Returns:
         Dictionary with "latitude" and "longitude" keys
     """
-    geo_line_split = geo_line.split(KEY_VALUE_SEPARATOR)
-    lat, lon = "", ""
-
-    if len(geo_line_split) == 2:
-        # vCard 2.1 or 3.0 format: GEO:lat;lon
-        lat, lon = geo_line_split[1].split(TAG_FIELD_SEPARATOR)
-    elif len(geo_line_split) == 3:
+    # The payload follows the first colon in both formats; a "geo:" URI
+    # prefix marks the 4.0 comma-separated form. Two partitions, no
+    # intermediate lists.
+    _, _, rest = geo_line.partition(KEY_VALUE_SEPARATOR)
+    if rest.startswith("geo:"):
         # vCard 4.0 format: GEO;TYPE=work:geo:lat,lon
-        lat, lon = geo_line_split[2].split(",")
-
+        rest = rest[4:]
+        separator = ","
+    else:
+        # vCard 2.1 or 3.0 format: GEO:lat;lon
+        separator = TAG_FIELD_SEPARATOR
+    lat, _, lon = rest.partition(separator)
     return {"latitude": lat, "longitude": lon}
 
 
@@ -208,7 +239,7 @@ def parse_instant_messenger_handle_tag(impp_line: str) -> dict:
     Returns:
         Dictionary with "type" and "handle" keys
     """
-    _, impp_type, impp_handle = impp_line.split(KEY_VALUE_SEPARATOR)
+    _, impp_type, impp_handle = impp_line.split(KEY_VALUE_SEPARATOR, 2)
     return {"type": impp_type, "handle": impp_handle}
 
 
@@ -239,9 +270,9 @@ def parse_member_tag(member_line: str) -> dict:
     Returns:
         Dictionary mapping member ID type to member ID value
     """
-    member_line_split = member_line.split(KEY_VALUE_SEPARATOR)
-    _, member_id_type = member_line_split[0], member_line_split[1]
-    member_id_value = KEY_VALUE_SEPARATOR.join(member_line_split[2:])
+    member_line_split = member_line.split(KEY_VALUE_SEPARATOR, 2)
+    member_id_type = member_line_split[1]
+    member_id_value = member_line_split[2] if len(member_line_split) > 2 else ""
     return {member_id_type: member_id_value}
 
 
@@ -263,14 +294,7 @@ def parse_name_tag(name_line: str) -> dict:
         - honorific_suffixes
     """
     name_line_split = name_line.split(TAG_FIELD_SEPARATOR)
-    subname_key_types = [
-        "family_name",
-        "given_name",
-        "additional_middle_names",
-        "honorific_prefixes",
-        "honorific_suffixes",
-    ]
-    return helper_match_subkey_types_and_values(subname_key_types, name_line_split)
+    return helper_match_subkey_types_and_values(_NAME_SUBKEY_TYPES, name_line_split)
 
 
 def return_name_tag_formatted(name_tag_field: dict) -> str:
@@ -293,10 +317,9 @@ def return_name_tag_formatted(name_tag_field: dict) -> str:
         ... })
         'KennedyJohnF'
     """
-    name = ""
-    for name_label in name_tag_field:
-        name += name_tag_field[name_label]
-    return name
+    # One join allocates the final string once; insertion order of the
+    # dict matches the order the name components were parsed in
+    return "".join(name_tag_field.values())
 
 
 def parse_organization_tag(organization_line: str) -> typing.Union[str, dict]:
@@ -324,13 +347,8 @@ def parse_organization_tag(organization_line: str) -> typing.Union[str, dict]:
         return organization_line.split(KEY_VALUE_SEPARATOR)[1]
     else:
         # Complex format with subfields
-        sub_org_key_types = [
-            "organization_name",
-            "collective_organization_name",
-            "organizational_unit_name",
-        ]
         return helper_match_subkey_types_and_values(
-            sub_org_key_types, organization_line_split
+            _ORG_SUBKEY_TYPES, organization_line_split
         )
 
 
@@ -376,12 +394,33 @@ def parse_uuid_tag(uuid_textline: str) -> dict:
     Returns:
         Dictionary with UID type as key and UID data as value
     """
-    uid_line_split = uuid_textline.split(KEY_VALUE_SEPARATOR)
+    uid_line_split = uuid_textline.split(KEY_VALUE_SEPARATOR, 2)
     uid_type = uid_line_split[1]
-    uid_data = KEY_VALUE_SEPARATOR.join(uid_line_split[2:])
+    uid_data = uid_line_split[2] if len(uid_line_split) > 2 else ""
     return {uid_type: uid_data}
 
 
+# One precompiled pattern discriminates all six multimedia tag formats
+# (see parse_multimedia_tag) in a single C-level scan, instead of a
+# cascade of splits and startswith checks per line. Alternatives are
+# ordered most-specific first so e.g. "TYPE=...;ENCODING=..." (case 4)
+# is tried before the bare "TYPE=...:" of case 3. The leading [^;:]*
+# tolerates an optional tag-name prefix, so the parser accepts lines
+# both with and without the tag name stripped.
+_MULTIMEDIA_TAG_RE = re.compile(
+    r"^[^;:]*"
+    r"(?:"
+    r";ENCODING=BASE64;(?P<type_2a>[^;:]+):(?P<data_2a>.*)"  # case 2a
+    r"|;TYPE=(?P<type_4>[^;:]+);ENCODING=(?:BASE64|b):(?P<data_4>.*)"  # case 4
+    r"|;(?P<type_2>[^;:=]+);ENCODING=BASE64:(?P<data_2>.*)"  # case 2
+    r"|;TYPE=(?P<type_3>[^;:]+):(?P<url_3>.*)"  # case 3
+    r"|;MEDIATYPE=(?P<mime_5>[^;:]+):(?P<url_5>.*)"  # case 5
+    r"|:data:(?P<mime_6>[^;]+);base64,(?P<data_6>.*)"  # case 6
+    r"|;(?P<type_1>[^;:=]+):(?P<url_1>.*)"  # case 1
+    r")$"
+)
+
+
 def parse_multimedia_tag(multimedia_tag_line: str) -> dict:
     """
     Parse a multimedia tag (PHOTO, SOUND, LOGO, KEY) from a vCard.
@@ -411,66 +450,24 @@ def parse_multimedia_tag(multimedia_tag_line: str) -> dict:
     Raises:
         Exception: If the multimedia tag format cannot be parsed
     """
-    multimedia_tag_line_split = multimedia_tag_line.split(TAG_FIELD_SEPARATOR)
-    tag_type, tag_data, tag_url, tag_mime_type = "", "", "", ""
-
-    if len(multimedia_tag_line_split) == 3:
-        # Case 2, 2a, or 4
-        if TYPE_ASSIGNMENT_OR_LABEL_SEPARATOR in multimedia_tag_line_split[1]:
-            if multimedia_tag_line_split[1] == "ENCODING=BASE64":
-                # Case 2a: ENCODING=BASE64 comes before TYPE
-                tag_type, tag_data = multimedia_tag_line_split[2].split(
-                    KEY_VALUE_SEPARATOR
-                )
-            else:
-                # Case 4: TYPE=<type>;ENCODING=b
-                tag_type = multimedia_tag_line_split[1].split(
-                    TYPE_ASSIGNMENT_OR_LABEL_SEPARATOR
-                )[1]
-                tag_data = multimedia_tag_line_split[2].split(KEY_VALUE_SEPARATOR)[1]
-        else:
-            # Case 2: TYPE;ENCODING=BASE64
-            tag_type = multimedia_tag_line_split[2].split(KEY_VALUE_SEPARATOR)[0]
-            tag_data = multimedia_tag_line_split[-1].split(KEY_VALUE_SEPARATOR)[1]
-
-    elif len(multimedia_tag_line_split) == 2:
-        # Case 1, 3, 5, or 6
-        if multimedia_tag_line_split[1].startswith("TYPE"):
-            # Case 3: TYPE=<type>:url
-            multimedia_type_decl_split = multimedia_tag_line_split[1].split(
-                KEY_VALUE_SEPARATOR
-            )
-            tag_type = multimedia_type_decl_split[0].split(
-                TYPE_ASSIGNMENT_OR_LABEL_SEPARATOR
-            )[1]
-            tag_url = multimedia_type_decl_split[1]
-
-        elif multimedia_tag_line_split[1].startswith("MEDIATYPE"):
-            # Case 5: MEDIATYPE=<mime>:url
-            multimedia_mediatype_decl_split = multimedia_tag_line_split[1].split(
-                KEY_VALUE_SEPARATOR
-            )
-            tag_mime_type = multimedia_mediatype_decl_split[0].split(
-                TYPE_ASSIGNMENT_OR_LABEL_SEPARATOR
-            )[1]
-            tag_url = multimedia_mediatype_decl_split[1]
-
-        elif multimedia_tag_line_split[1].startswith("base64"):
-            # Case 6: data:mime;base64,data
-            tag_mime_type = multimedia_tag_line_split[0].split(KEY_VALUE_SEPARATOR)[-1]
-            tag_data = multimedia_tag_line_split[1].split(",")[1]
-
-        else:
-            # Case 1: TYPE:url
-            tag_type_and_url_split = multimedia_tag_line_split[1].split(
-                KEY_VALUE_SEPARATOR
-            )
-            tag_type = tag_type_and_url_split[0]
-            tag_url = ":".join(tag_type_and_url_split[1:])
-
-    else:
+    match = _MULTIMEDIA_TAG_RE.match(multimedia_tag_line)
+    if match is None:
         raise ValueError(f"Can't parse multimedia tag: '{multimedia_tag_line}'")
 
+    # Exactly one alternative matched; its groups hold the fields, the
+    # rest default to ""
+    groups = match.groupdict("")
+    tag_type = (
+        groups["type_2a"]
+        or groups["type_4"]
+        or groups["type_2"]
+        or groups["type_3"]
+        or groups["type_1"]
+    )
+    tag_data = groups["data_2a"] or groups["data_4"] or groups["data_2"] or groups["data_6"]
+    tag_url = groups["url_3"] or groups["url_5"] or groups["url_1"]
+    tag_mime_type = groups["mime_5"] or groups["mime_6"]
+
     return helper_match_subkey_types_and_values(
         vcard_multimedia_helper.get_multimedia_tag_list(),
         [tag_type, tag_data, tag_url, tag_mime_type],
@@ -481,6 +478,14 @@ def parse_multimedia_tag(multimedia_tag_line: str) -> dict:
 # Helper functions
 
 
+# Shared result for all-empty value lists (placeholder lines like
+# "N:;;;;"), so thousands of placeholder fields don't each allocate an
+# empty dict. A plain dict rather than types.MappingProxyType because
+# parsed contacts cross the process-pool pickle boundary and proxies
+# don't pickle; parse results are treated as read-only by callers.
+_EMPTY_FIELDS: dict = {}
+
+
 def helper_match_subkey_types_and_values(
     subkey_names: typing.List[str],
     values: typing.List[str],
@@ -514,17 +519,12 @@ def helper_match_subkey_types_and_values(
             f"Only {len(values)} subfields found, but {len(subkey_names)} are required"
         )
 
-    # Create pairs of (name, value) for non-empty values
-    label_and_data_pairs = tuple(
-        (name, value) for name, value in zip(subkey_names, values) if value
-    )
-
-    # Build result dictionary
-    result_dict = {}
-    for name, value in label_and_data_pairs:
-        result_dict[name] = value
+    if not any(values):
+        return _EMPTY_FIELDS
 
-    return result_dict
+    # Map subkeys to their non-empty values in one pass; the dict
+    # comprehension runs the zip, filter, and inserts at C level
+    return {name: value for name, value in zip(subkey_names, values) if value}
 
 
 def helper_match_generic_label_and_types(text_line: str) -> dict:
@@ -534,6 +534,10 @@ def helper_match_generic_label_and_types(text_line: str) -> dict:
     Handles lines of the form: <KEY>;TYPE=<KEY_TYPE>:<KEY_DATA>
     or <KEY>;<KEY_TYPE>:<KEY_DATA>
 
+    Repeated lines (shared TEL prefixes, templated TYPE=HOME fields) hit
+    the memoized parse; the copy here keeps callers from mutating the
+    cached dict.
+
     Args:
         text_line: vCard line to parse
 
@@ -541,16 +545,47 @@ def helper_match_generic_label_and_types(text_line: str) -> dict:
         Dictionary with type as key and data as value
         Example: {"INTERNET": "email@example.com"}
     """
-    text_line_split = text_line.split(KEY_VALUE_SEPARATOR)
-    data = KEY_VALUE_SEPARATOR.join(text_line_split[1:])
+    return dict(_match_generic_label_and_types_cached(text_line))
+
 
-    # Extract type from either TYPE=value or just value format
+@lru_cache(maxsize=4096)
+def _match_generic_label_and_types_cached(text_line: str) -> dict:
+    """Cached worker for helper_match_generic_label_and_types."""
+    # partition scans once and keeps any colons inside the data intact
+    head, _, data = text_line.partition(KEY_VALUE_SEPARATOR)
+
+    # Extract type from either TYPE=value or just value format.
+    # maxsplit=2 because only the second token is consulted.
     data_type = ""
-    if TYPE_ASSIGNMENT_OR_LABEL_SEPARATOR in text_line_split[0]:
+    if TYPE_ASSIGNMENT_OR_LABEL_SEPARATOR in head:
         # Format: TYPE=value
-        data_type = text_line_split[0].split("=")[1]
+        data_type = head.split(TYPE_ASSIGNMENT_OR_LABEL_SEPARATOR, 2)[1]
     else:
         # Format: value (without TYPE=)
-        data_type = text_line_split[0].split(TAG_FIELD_SEPARATOR)[1]
-
-    return {data_type: data}
+        data_type = head.split(TAG_FIELD_SEPARATOR, 2)[1]
+
+    # TYPE tokens ("CELL", "INTERNET", ...) recur across contacts and
+    # become dict keys downstream; interning shares one object per token
+    return {sys.intern(data_type): data}
+
+
+# Dispatch table mapping vCard field names to their parser functions.
+# Callers resolve a line's parser with one dict lookup on the leading
+# field name instead of comparing against every known tag in turn.
+# Simple key:value tags (SIMPLE_KEYS) and multimedia tags
+# (vcard_multimedia_helper.ADVANCED_KEY_SET) are dispatched separately.
+PARSERS: typing.Dict[str, typing.Callable[[str], typing.Union[dict, tuple, str]]] = {
+    "ADR": parse_address_tag,
+    "CATEGORIES": parse_categories_tag,
+    "CLIENTPIDMAP": parse_clientpidmap_tag,
+    "EMAIL": parse_email_tag,
+    "GEO": parse_geo_tag,
+    "IMPP": parse_instant_messenger_handle_tag,
+    "LABEL": parse_mailing_label_tag,
+    "MEMBER": parse_member_tag,
+    "N": parse_name_tag,
+    "ORG": parse_organization_tag,
+    "RELATED": parse_related_tag,
+    "TEL": parse_telephone_tag,
+    "UID": parse_uuid_tag,
+}
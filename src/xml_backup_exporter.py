@@ -20,6 +20,7 @@ Credits:
 import argparse
 import os
 from argparse import RawTextHelpFormatter
+from functools import lru_cache
 
 from . import call_log_generator
 from . import contacts_vcard_extractor
@@ -27,6 +28,7 @@ from . import mms_media_extractor
 from . import sms_text_extractor
 
 
+@lru_cache(maxsize=128)
 def normalize_path(path: str) -> str:
     """
     Normalize a file path to handle various input formats.
@@ -37,6 +39,10 @@ def normalize_path(path: str) -> str:
     - Path separator normalization
     - Conversion to absolute paths
 
+    Results are cached (the normalization is a pure function of the input
+    string for a given $HOME and working directory), so repeat calls with
+    the same path string are free.
+
     Args:
         path: Input path string (can be relative, absolute, or use ~)
 